@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Callable
 
 import ninja
 from django.apps import apps
@@ -19,12 +19,15 @@ class AutoDojoRouter:
         auth_class: type = None,
         response_schema_configs: dict[str, dict[str, Any]] = None,
         request_schema_configs: dict[str, dict[str, Any]] = None,
+        fast_json_rendering: bool = False,
     ):
         """ """
         # Despite the kwargs all having defaults, the following args MUST be non-None.
         # The reason the signature is like this is so the call can be somewhat self-describing
-        required_kwargs = ["app_label", "model"]
-        self._enforce_required_kwargs(locals(), required_kwargs)
+        if app_label is None:
+            raise ValueError("'app_label' cannot be None")
+        if model is None:
+            raise ValueError("'model' cannot be None")
 
         self.response_schema_configs = (
             response_schema_configs if response_schema_configs else {}
@@ -48,9 +51,38 @@ class AutoDojoRouter:
         # Now, let's wire everything up in the router
         self._router = ninja.Router(auth=self.auth_class)
 
-        # Generate required method implementations
+        # Generate required method implementations. Every view is generated
+        # before any are registered, so a failure while generating one
+        # doesn't leave a partially populated router behind.
         # TODO: allow control/configuration of status-code specific
         #       response configurations.
+        operations = self._generate_operations(http_methods, fast_json_rendering)
+
+        for url_path, method_verb, response_config, view_func in operations:
+            self._router.add_api_operation(
+                url_path,
+                methods=[method_verb],
+                response=response_config,
+                view_func=view_func,
+                tags=[self.model_class_name],
+            )
+
+    @property
+    def router(self) -> ninja.Router:
+        return self._router
+
+    @property
+    def add_router_args(self) -> tuple[str, ninja.Router]:
+        return self.base_url_path, self._router
+
+    def _generate_operations(
+        self, http_methods: list[str], fast_json_rendering: bool
+    ) -> list[tuple[str, str, dict[int, Any], Callable]]:
+        """
+        Generate views for each HTTP method, returning the arguments needed
+        to add each one to a Ninja Router.
+        """
+        operations = []
         for http_method in http_methods:
             auto_view = AutoDojoView(
                 self.model_class,
@@ -61,6 +93,7 @@ class AutoDojoRouter:
                 response_schema_config=self.response_schema_configs.get(
                     http_method, None
                 ),
+                fast_json_rendering=fast_json_rendering,
             )
 
             # "GETLIST" in particular will need to be translated to "GET"
@@ -68,31 +101,15 @@ class AutoDojoRouter:
                 http_method, http_method
             )
 
-            self._router.add_api_operation(
-                auto_view.url_path,
-                methods=[actual_method_verb],
-                response=auto_view.response_config,
-                view_func=auto_view.view_func,
-                tags=[self.model_class_name],
+            operations.append(
+                (
+                    auto_view.url_path,
+                    actual_method_verb,
+                    auto_view.response_config,
+                    auto_view.view_func,
+                )
             )
-
-    @property
-    def router(self) -> ninja.Router:
-        return self._router
-
-    @property
-    def add_router_args(self) -> tuple[str, ninja.Router]:
-        return self.base_url_path, self._router
-
-    def _enforce_required_kwargs(
-        self, called_args: dict, required_kwargs: list[str]
-    ) -> None:
-        for arg, value in called_args.items():
-            if arg not in required_kwargs:
-                continue
-
-            if value is None:
-                raise ValueError(f"'{arg}' cannot be None")
+        return operations
 
     def _resolve_orm_model_class(self, model: str | models.Model) -> models.Model:
         if isinstance(model, models.Model):
@@ -1,9 +1,18 @@
-from typing import Any, Type
+from typing import Any, Iterable, Type
 
 from django.db import models
 
 from ninja import ModelSchema, Schema
 
+from autodojo.constants import (
+    DEFAULT_METHODS,
+    DELETE,
+    GET,
+    GETLIST,
+    PATCH,
+    POST,
+    PUT,
+)
 from autodojo.generators import (
     AutoDojoDeleteGenerator,
     AutoDojoGetGenerator,
@@ -15,12 +24,12 @@ from autodojo.generators import (
 
 # Mapping of HTTP method names to their generation class
 method_generation_classes = {
-    "GET": AutoDojoGetGenerator,
-    "GETLIST": AutoDojoGetListGenerator,
-    "PATCH": AutoDojoPatchGenerator,
-    "DELETE": AutoDojoDeleteGenerator,
-    "POST": AutoDojoPostGenerator,
-    "PUT": AutoDojoPutGenerator,
+    GET: AutoDojoGetGenerator,
+    GETLIST: AutoDojoGetListGenerator,
+    PATCH: AutoDojoPatchGenerator,
+    DELETE: AutoDojoDeleteGenerator,
+    POST: AutoDojoPostGenerator,
+    PUT: AutoDojoPutGenerator,
 }
 
 
@@ -42,18 +51,17 @@ class AutoDojoView:
     For details of create_schema(), consult the Ninja documentation at
     https://django-ninja.dev/guides/response/django-pydantic-create-schema/
 
+    If fast_json_rendering is True, responses are validated and serialized
+    to JSON by Pydantic in a single pass and returned as a ready-made
+    HttpResponse, bypassing the NinjaAPI's renderer.
+
     This class can be used in isolation or used by the AutoDojoRouter
     to provide a more complete solution.
     """
 
-    SUPPORTED_METHODS = [
-        "GET",
-        "GETLIST",  # Special method to differentiate get all from get individual
-        "POST",
-        "PUT",
-        "DELETE",
-        "PATCH",
-    ]
+    # Every method with a generator class is supported, including the special
+    # "GETLIST" method that differentiates get all from get individual.
+    SUPPORTED_METHODS = frozenset(method_generation_classes)
 
     def __init__(
         self,
@@ -64,6 +72,7 @@ class AutoDojoView:
         request_schema_config: dict[str, Any] = None,
         response_schema_config: dict[str, Any] = None,
         doc_string: str = None,
+        fast_json_rendering: bool = False,
     ):
         if http_method not in self.SUPPORTED_METHODS:
             raise ValueError(f"Unsupported HTTP method: {http_method}")
@@ -92,19 +101,16 @@ class AutoDojoView:
 
         self.doc_string = doc_string
 
-        try:
-            self.generator_class = method_generation_classes[http_method](
-                model_class=self.model_class,
-                http_method=http_method,
-                request_schema=request_schema,
-                response_schema=response_schema,
-                request_schema_config=request_schema_config,
-                response_schema_config=response_schema_config,
-            )
-        except KeyError as ke:
-            raise NotImplementedError(
-                f"HTTP method has no generator class: {http_method}"
-            )
+        # Every supported method has a generator class, so no need to
+        # guard against a KeyError here.
+        self.generator_class = method_generation_classes[http_method](
+            model_class=self.model_class,
+            http_method=http_method,
+            request_schema=request_schema,
+            response_schema=response_schema,
+            request_schema_config=request_schema_config,
+            response_schema_config=response_schema_config,
+        )
 
         # Generate request and response schemas, if not provided
         self.request_schema = (
@@ -120,8 +126,8 @@ class AutoDojoView:
 
         self.url_path = self.generator_class.url_path
 
-        self.response_config = self.generator_class.response_config
         self.view_func = self.generator_class.generate_view_func()
+        self.response_config = self.generator_class.response_config
 
         # view_funcs receiving request schemas will need to patch
         # their signature type annotations at runtime.
@@ -132,3 +138,29 @@ class AutoDojoView:
         self.view_func = self.generator_class.patch_doc_string(
             self.view_func, docstring=self.doc_string
         )
+
+        if fast_json_rendering:
+            self.view_func = self.generator_class.wrap_json_rendering(self.view_func)
+
+    @classmethod
+    def generate_all(
+        cls,
+        model_class: Type[models.Model],
+        http_methods: Iterable[str] = DEFAULT_METHODS,
+        fast_json_rendering: bool = False,
+    ) -> dict[str, "AutoDojoView"]:
+        """
+        Generate views for several HTTP methods of the same model, with
+        default schema configuration, keyed by HTTP method.
+
+        This is a convenience over creating each AutoDojoView separately;
+        each view is still generated in full. It relies on the existing
+        per-model caches (relation fields, view name prefixes) and Ninja's
+        schema cache for any work the views have in common.
+        """
+        return {
+            http_method: cls(
+                model_class, http_method, fast_json_rendering=fast_json_rendering
+            )
+            for http_method in http_methods
+        }
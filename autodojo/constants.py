@@ -1,14 +1,22 @@
+from types import MappingProxyType
+
+# HTTP methods that AutoDojo knows how to generate views for
+GET = "GET"
+GETLIST = "GETLIST"  # Special method to differentiate from get-single-object
+POST = "POST"
+PATCH = "PATCH"
+PUT = "PUT"
+DELETE = "DELETE"
+
 # Special methods, especially "GETLIST" 'just work' in terms of lookup
 # for generator classes etc, but the HTTP method used will need to be
 # translated.
-SPECIAL_METHODS_TRANSLATION = {
-    "GETLIST": "GET",
-}
-DEFAULT_METHODS = (
-    "GET",
-    "GETLIST",  # Special method to differentiate from get-single-object
-    "POST",
-    "PATCH",
-    "PUT",
-    "DELETE",
+SPECIAL_METHODS_TRANSLATION = MappingProxyType(
+    {
+        GETLIST: GET,
+    }
 )
+DEFAULT_METHODS = (GET, GETLIST, POST, PATCH, PUT, DELETE)
+
+# For membership tests; DEFAULT_METHODS keeps its order for iteration.
+DEFAULT_METHODS_SET = frozenset(DEFAULT_METHODS)
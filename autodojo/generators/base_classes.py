@@ -1,11 +1,16 @@
-from typing import Any, Callable
+import functools
+from collections import defaultdict
+from typing import Any, Callable, Optional, Type
 
-from django.db.models import Model
+from django.db.models import Model, QuerySet
+from django.http import HttpRequest, HttpResponse
 
-from ninja import ModelSchema
+from ninja import Schema
 from ninja.orm import create_schema
+from pydantic import TypeAdapter
 
 from autodojo.constants import SPECIAL_METHODS_TRANSLATION
+from autodojo.generators.utility import get_eager_loading_lookups, get_relation_fields
 
 
 class AutoDojoViewGenerator:
@@ -20,12 +25,22 @@ class AutoDojoViewGenerator:
         Generated by AutoDojo.
         """
 
+    # Generator-specific defaults passed to create_schema(), which subclasses
+    # can override. Values supplied by users take precedence over these.
+    default_request_schema_config: dict[str, Any] = {}
+    default_response_schema_config: dict[str, Any] = {}
+
+    # The response schema (or None, for an empty body) for each status code
+    # the generated view can return, as passed to Ninja. Set by HTTP
+    # method-specific subclasses when they generate the view function.
+    response_config: dict[int, Optional[Any]]
+
     def __init__(
         self,
         model_class: Model,
         http_method: str,
-        request_schema: ModelSchema = None,
-        response_schema: ModelSchema = None,
+        request_schema: Type[Schema] = None,
+        response_schema: Type[Schema] = None,
         request_schema_config: dict[str, Any] = None,
         response_schema_config: dict[str, Any] = None,
         doc_string: str = None,
@@ -43,21 +58,54 @@ class AutoDojoViewGenerator:
         self.http_method = http_method
         self.doc_string = doc_string
 
+        # Response body for requests referring to objects that don't exist.
+        # Generated view functions bind this, and anything else they need
+        # from the generator, to local variables when they're created, so
+        # handling a request doesn't involve attribute lookups via 'self'.
+        self.not_found_response = {
+            "api_error": f"Requested {self.model_class_name} object does not exist",
+        }
+
+        # The actual HTTP verb, "GETLIST" for example is really a "GET".
+        # Used when formatting schema names and docstrings.
+        http_verb = SPECIAL_METHODS_TRANSLATION.get(http_method, http_method)
+        self._http_verb_title = http_verb.title()
+        self._http_verb_upper = http_verb.upper()
+
         # Note which fields in the model are Foreign Key fields and which
-        # are M2M fields.
-        self.fk_fields = dict()
-        self.m2m_fields = dict()
-        for f in self.model_class._meta.get_fields():
-            if not f.is_relation:
-                continue
-            if f.many_to_one or f.one_to_one:
-                self.fk_fields[f.name] = f
-            elif f.many_to_many:
-                self.m2m_fields[f.name] = f
+        # are M2M fields. These dictionaries are shared by every generator
+        # for the model, so must not be modified.
+        self.fk_fields, self.m2m_fields = get_relation_fields(self.model_class)
+
+        # Fields Django sets itself on every save(). These must always be
+        # included when saving with 'update_fields', or they'd be skipped.
+        self.auto_now_field_names = [
+            f.name
+            for f in self.model_class._meta.concrete_fields
+            if getattr(f, "auto_now", False)
+        ]
+
+        # Fields whose values are computed by the database when a row is
+        # saved, so need re-reading afterwards. Everything else written by
+        # save() is already up-to-date on the in-memory object (auto_now
+        # values are set in Python before saving, for example).
+        self.db_computed_field_names = [
+            f.attname
+            for f in self.model_class._meta.concrete_fields
+            if getattr(f, "generated", False)
+        ]
+
+        # Related model lookups for FK fields, so generated views can tell
+        # whether a payload attribute is a foreign key with a single dict
+        # lookup, rather than consulting the model's _meta per request.
+        self._fk_related_models = {
+            name: field.related_model for name, field in self.fk_fields.items()
+        }
+        self._fk_field_names = frozenset(self.fk_fields)
 
     def generate_request_schema(
         self,
-    ) -> ModelSchema:
+    ) -> Type[Schema]:
         """
         Generate a schema to be used for incoming request payloads but catches
         attempts to generate a schema in situations where one was explicitly
@@ -75,7 +123,7 @@ class AutoDojoViewGenerator:
 
     def generate_response_schema(
         self,
-    ) -> ModelSchema:
+    ) -> Type[Schema]:
         """
         Generate a schema to be used for outgoing response payloads but catches
         attempts to generate a schema in situations where one was explicitly
@@ -91,6 +139,24 @@ class AutoDojoViewGenerator:
         self.response_schema = create_schema(self.model_class, **schema_config)
         return self.response_schema
 
+    def _response_queryset(self) -> QuerySet:
+        """
+        A queryset for the model that loads any related objects included in
+        the response schema up-front, rather than with a separate query for
+        each one while the response is serialized.
+
+        Must be called after the response schema has been generated.
+        """
+        select_related, prefetch_related = get_eager_loading_lookups(
+            self.model_class, self.response_schema
+        )
+        queryset = self.model_class.objects.all()
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
+
     def patch_view_signature(self, view_func: Callable) -> Callable:
         """
         Programmatically-generated view functions can specify parameter
@@ -104,6 +170,53 @@ class AutoDojoViewGenerator:
         """
         return view_func
 
+    def wrap_json_rendering(self, view_func: Callable) -> Callable:
+        """
+        Wrap a generated view function so that its results are validated and
+        serialized to JSON by Pydantic directly, returning a ready-made
+        HttpResponse. This skips Ninja's model_dump() and json.dumps() passes.
+
+        Note that this bypasses any custom renderer configured on the NinjaAPI
+        instance. Status codes without a response schema (ie: an empty body)
+        are still handed back to Ninja as usual.
+
+        Must be called after the view function has been generated, as
+        adapters for every response schema are built up-front.
+        """
+        self._response_adapters = {
+            status: TypeAdapter(schema)
+            for status, schema in self.response_config.items()
+            if schema is not None
+        }
+
+        @functools.wraps(view_func)
+        def json_rendering_view_func(request: HttpRequest, *args, **kwargs):
+            result = view_func(request, *args, **kwargs)
+            status, body = result if isinstance(result, tuple) else (200, result)
+            if status not in self._response_adapters:
+                return result
+
+            return HttpResponse(
+                self.render_response(request, status, body),
+                status=status,
+                content_type="application/json",
+            )
+
+        return json_rendering_view_func
+
+    def render_response(self, request: HttpRequest, status: int, body: Any) -> bytes:
+        """
+        Validate a view's response body against the response schema for the
+        given status code and serialize it to JSON bytes.
+        """
+        adapter = self._response_adapters[status]
+        validated = adapter.validate_python(
+            body,
+            from_attributes=True,
+            context={"request": request, "response_status": status},
+        )
+        return adapter.dump_json(validated)
+
     def patch_doc_string(self, view_func: Callable, docstring: str = None) -> Callable:
         used_docstring = ""
         if docstring is not None:
@@ -115,12 +228,8 @@ class AutoDojoViewGenerator:
                 )
             used_docstring = self.default_docstring
 
-        http_verb = SPECIAL_METHODS_TRANSLATION.get(
-            self.http_method, self.http_method
-        ).upper()
-
         view_func.__doc__ = used_docstring.format(
-            model=self.model_class_name, http_verb=http_verb
+            model=self.model_class_name, http_verb=self._http_verb_upper
         )
 
         return view_func
@@ -129,90 +238,72 @@ class AutoDojoViewGenerator:
         """
         Resolve any foreign key references received in a payload dictionary
         into actual ORM objects, suitable for passing into the ORM model's
-        'create()' method.
+        'create()' method or assigning to an existing object.
+
+        Referenced objects are fetched with one query per related model,
+        rather than one query per foreign key field.
         """
+        if self._fk_field_names.isdisjoint(payload_dict):
+            return payload_dict
+
+        # Group the referenced primary keys by the model they refer to
+        references_by_model: defaultdict[type[Model], dict[str, Any]] = defaultdict(
+            dict
+        )
         for field_name, value in payload_dict.items():
-            if field_name in self.fk_fields:
-                related_model = self.fk_fields[field_name].related_model
-                try:
-                    related_object = related_model.objects.get(pk=value)
-                except related_model.DoesNotExist:
+            related_model = self._fk_related_models.get(field_name)
+            if related_model is not None:
+                references_by_model[related_model][field_name] = value
+
+        for related_model, references in references_by_model.items():
+            related_objects = related_model.objects.in_bulk(set(references.values()))
+            for field_name, pk in references.items():
+                if pk not in related_objects:
                     # append '_id' suffix so the reported field name matches
                     # what the user supplied in the input JSON
                     message = f"{related_model._meta.object_name} referenced by '{field_name}_id' does not exist!"
                     # TODO: Consider custom exception?
                     raise AttributeError(message)
-                payload_dict[field_name] = related_object
+                payload_dict[field_name] = related_objects[pk]
 
-    def _determine_request_schema_config(self) -> dict[str, Any]:
-        # The create_schema() call won't accept None for the
-        # kwargs dict, so we need an actual dictionary
-        schema_config = {}
-
-        # Setup generator-specific defaults, if present
-        if hasattr(self, "default_request_schema_config"):
-            if not isinstance(self.default_request_schema_config, dict):
-                raise TypeError(
-                    f"{self.__class__.__name__}.default_request_schema_config must be a dict"
-                )
-
-            schema_config = self.default_request_schema_config.copy()
-
-            # Now apply schema configs that may have been supplied by
-        # the user
-        if self.request_schema_config:
-            for key, value in self.request_schema_config.items():
-                schema_config[key] = value
-
-        # Double-check for a defined 'name'. If not provided by
-        # defaults or user-supplied configuration, then we'll
-        # automatically generate one. Note that if the name WAS
-        # provided by defaults or user configuration, we'll treat
-        # it as a format string and supply 'model' and 'http_verb'.
-        http_verb = SPECIAL_METHODS_TRANSLATION.get(
-            self.http_method, self.http_method
-        ).title()
-        if "name" not in schema_config:
-            schema_config["name"] = f"Generated{self.model_class_name}{http_verb}In"
-        else:
-            schema_config["name"] = schema_config["name"].format(
-                model=self.model_class_name, http_verb=http_verb
-            )
+        return payload_dict
 
-        return schema_config
+    def _determine_request_schema_config(self) -> dict[str, Any]:
+        return self._determine_schema_config(
+            "default_request_schema_config", self.request_schema_config, "In"
+        )
 
     def _determine_response_schema_config(self) -> dict[str, Any]:
-        # The create_schema() call won't accept None for the
-        # kwargs dict, so we need an actual dictionary
-        schema_config = {}
+        return self._determine_schema_config(
+            "default_response_schema_config", self.response_schema_config, "Out"
+        )
 
-        # Setup generator-specific defaults, if present
-        if hasattr(self, "default_response_schema_config"):
-            if not isinstance(self.default_response_schema_config, dict):
-                raise TypeError(
-                    f"{self.__class__.__name__}.default_response_schema_config must be a dict"
-                )
-            schema_config = self.default_response_schema_config.copy()
+    def _determine_schema_config(
+        self, defaults_attribute: str, user_config: dict[str, Any], name_suffix: str
+    ) -> dict[str, Any]:
+        defaults = getattr(self, defaults_attribute)
+        if not isinstance(defaults, dict):
+            raise TypeError(
+                f"{self.__class__.__name__}.{defaults_attribute} must be a dict"
+            )
 
-        # Now apply schema configs that may have been supplied by
-        # the user
-        if self.response_schema_config:
-            for key, value in self.response_schema_config.items():
-                schema_config[key] = value
+        # Start with generator-specific defaults, then apply schema configs
+        # that may have been supplied by the user. The create_schema() call
+        # won't accept None for the kwargs dict, so we need an actual dictionary.
+        schema_config = {**defaults, **user_config}
 
         # Double-check for a defined 'name'. If not provided by
         # defaults or user-supplied configuration, then we'll
         # automatically generate one. Note that if the name WAS
         # provided by defaults or user configuration, we'll treat
         # it as a format string and supply 'model' and 'http_verb'.
-        http_verb = SPECIAL_METHODS_TRANSLATION.get(
-            self.http_method, self.http_method
-        ).title()
         if "name" not in schema_config:
-            schema_config["name"] = f"Generated{self.model_class_name}{http_verb}Out"
+            schema_config["name"] = (
+                f"Generated{self.model_class_name}{self._http_verb_title}{name_suffix}"
+            )
         else:
             schema_config["name"] = schema_config["name"].format(
-                model=self.model_class_name, http_verb=http_verb
+                model=self.model_class_name, http_verb=self._http_verb_title
             )
 
         return schema_config
@@ -1,5 +1,7 @@
-from typing import Callable, Any, Optional
+from typing import Callable
 
+from django.db.models import Model
+from django.db.models.signals import post_delete, pre_delete
 from django.http import HttpRequest
 from ninja import Schema
 
@@ -13,14 +15,35 @@ class AutoDojoDeleteGenerator(AutoDojoViewGenerator):
     Generator for DELETE endpoint
     """
 
+    url_path = "/{int:id}"
+
     def generate_view_func(self) -> Callable:
+        self.response_config = {200: None, 404: DefaultErrorResponseSchema}
+
+        model_class = self.model_class
+        manager = self.model_class.objects
+        does_not_exist = self.model_class.DoesNotExist
+        not_found_response = self.not_found_response
+
+        # Only the primary key is needed to delete the object, unless
+        # something gets to look at it while it's deleted. A deferred field
+        # read after the row is gone can't be loaded from the database.
+        can_fetch_pk_only = model_class.delete is Model.delete
+
         def delete_view_func(request: HttpRequest, id: int, *args, **kwargs):
+            if (
+                can_fetch_pk_only
+                and not pre_delete.has_listeners(model_class)
+                and not post_delete.has_listeners(model_class)
+            ):
+                queryset = manager.only("pk")
+            else:
+                queryset = manager.all()
+
             try:
-                deleted_object = self.model_class.objects.get(pk=id)
-            except self.model_class.DoesNotExist:
-                return 404, {
-                    "api_error": f"Requested {self.model_class_name} object does not exist",
-                }
+                deleted_object = queryset.get(pk=id)
+            except does_not_exist:
+                return 404, not_found_response
 
             deleted_object.delete()
 
@@ -29,11 +52,3 @@ class AutoDojoDeleteGenerator(AutoDojoViewGenerator):
         returned_func = ensure_unique_name(self.model_class, delete_view_func)
 
         return returned_func
-
-    @property
-    def url_path(self) -> str:
-        return "/{int:id}"
-
-    @property
-    def response_config(self) -> dict[int, Optional[Any]]:
-        return {200: None, 404: DefaultErrorResponseSchema}
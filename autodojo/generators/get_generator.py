@@ -1,4 +1,4 @@
-from typing import Callable, Any, Optional
+from typing import Callable
 
 from django.http import HttpRequest
 
@@ -12,52 +12,54 @@ class AutoDojoGetListGenerator(AutoDojoViewGenerator):
     Generator for GET all (ie: List all) endpoint
     """
 
+    url_path = "/"
     default_response_schema_config = {"name": "Generated{model}Out"}
 
+    # Rows are streamed from the database in chunks of this size, rather
+    # than loading the whole table into the QuerySet's result cache.
+    iterator_chunk_size = 2000
+
     def generate_view_func(self) -> Callable:
+        self.response_config = {200: list[self.response_schema]}
+
+        queryset = self._response_queryset()
+        chunk_size = self.iterator_chunk_size
+
         def get_list_view_func(request: HttpRequest, *args, **kwargs):
-            object_collection = self.model_class.objects.all()
+            object_collection = queryset.all().iterator(chunk_size=chunk_size)
             return 200, object_collection
 
         returned_func = ensure_unique_name(self.model_class, get_list_view_func)
 
         return returned_func
 
-    @property
-    def url_path(self) -> str:
-        return "/"
-
-    @property
-    def response_config(self) -> dict[int, Optional[Any]]:
-        return {200: list[self.response_schema]}
-
 
 class AutoDojoGetGenerator(AutoDojoViewGenerator):
     """
     Generator for GET single item endpoint
     """
 
+    url_path = "/{int:id}"
     default_response_schema_config = {"name": "Generated{model}Out"}
 
     def generate_view_func(self) -> Callable:
+        self.response_config = {
+            200: self.response_schema,
+            404: DefaultErrorResponseSchema,
+        }
+
+        queryset = self._response_queryset()
+        does_not_exist = self.model_class.DoesNotExist
+        not_found_response = self.not_found_response
+
         def get_view_func(request: HttpRequest, id: int, *args, **kwargs):
             try:
-                db_object = self.model_class.objects.get(pk=id)
-            except self.model_class.DoesNotExist:
-                return 404, {
-                    "api_error": f"Requested {self.model_class_name} object does not exist",
-                }
+                db_object = queryset.get(pk=id)
+            except does_not_exist:
+                return 404, not_found_response
 
             return 200, db_object
 
         returned_func = ensure_unique_name(self.model_class, get_view_func)
 
         return returned_func
-
-    @property
-    def url_path(self) -> str:
-        return "/{int:id}"
-
-    @property
-    def response_config(self) -> dict[int, Optional[Any]]:
-        return {200: self.response_schema, 404: DefaultErrorResponseSchema}
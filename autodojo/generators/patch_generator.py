@@ -1,8 +1,8 @@
-from typing import Callable, Any, Optional
+from typing import Callable
 
-from django.db.models.fields.related import ForeignKey
+from django.db.models import Field, Model
+from django.db.models.signals import post_save, pre_save
 from django.http import HttpRequest
-from django.db.models import Model
 
 from ninja import ModelSchema
 
@@ -16,10 +16,43 @@ class AutoDojoPatchGenerator(AutoDojoViewGenerator):
     Generator for PATCH
     """
 
+    url_path = "/{int:id}"
     default_request_schema_config = {"exclude": ("id",), "optional_fields": "__all__"}
     default_response_schema_config = {"name": "Generated{model}Out"}
 
     def generate_view_func(self) -> Callable:
+        self.response_config = {
+            200: self.response_schema,
+            404: DefaultErrorResponseSchema,
+        }
+
+        model_class = self.model_class
+        manager = model_class.objects
+        queryset = self._response_queryset()
+        does_not_exist = model_class.DoesNotExist
+        not_found_response = self.not_found_response
+        auto_now_field_names = self.auto_now_field_names
+        db_computed_field_names = self.db_computed_field_names
+        resolve_fk_references = self._resolve_fk_references
+
+        # Payloads can be applied with a single UPDATE query, rather than
+        # fetching, modifying and saving the object. That skips save()
+        # entirely, so is only done when the model doesn't customise save()
+        # or rely on it to set auto_now fields.
+        can_update_in_place = (
+            model_class.save is Model.save and not auto_now_field_names
+        )
+
+        # It also skips each field's pre_save() hook, so only payloads made
+        # up of fields that don't customise it (unlike FileField, for
+        # example) can be applied this way. Foreign keys are left out too,
+        # as referenced objects need checking first.
+        update_in_place_field_names = frozenset(
+            f.name
+            for f in model_class._meta.concrete_fields
+            if not f.is_relation and type(f).pre_save is Field.pre_save
+        )
+
         def patch_view_func(
             request: HttpRequest, id: int, payload: ModelSchema, *args, **kwargs
         ):
@@ -34,57 +67,50 @@ class AutoDojoPatchGenerator(AutoDojoViewGenerator):
             If the requested object doesn't, exist, then 404 status will be returned with
             an error message.
             """
-            call_args = locals()
+            patch_fields = payload.model_dump(exclude_unset=True)
+
+            if (
+                can_update_in_place
+                and patch_fields
+                and update_in_place_field_names.issuperset(patch_fields)
+                and not pre_save.has_listeners(model_class)
+                and not post_save.has_listeners(model_class)
+            ):
+                if not manager.filter(pk=id).update(**patch_fields):
+                    return 404, not_found_response
+
+                # The object may have been deleted since it was updated
+                try:
+                    return 200, queryset.get(pk=id)
+                except does_not_exist:
+                    return 404, not_found_response
+
             # Look up the object being modified, if it exists
             try:
-                patched_object = self.model_class.objects.get(pk=id)
-            except self.model_class.DoesNotExist:
-                return 404, {
-                    "api_error": f"Requested {self.model_class_name} object does not exist",
-                }
+                patched_object = queryset.get(pk=id)
+            except does_not_exist:
+                return 404, not_found_response
 
-            patch_fields = payload.dict(exclude_unset=True)
+            # If any referenced models can't be found, report them as not found
+            try:
+                resolve_fk_references(patch_fields)
+            except AttributeError as ae:
+                return 404, {"api_error": str(ae)}
 
             for attr, value in patch_fields.items():
-                # Determine if the supplied attribute is a foreign key or not
-                # Check for a field of the supplied attribute name
-                field_meta = self.model_class._meta.get_field(attr)
-
-                if field_meta.__class__ is ForeignKey:
-                    # Ninja appears to take  Model.fk_field and treat "fk_field" and "fk_field_id" the same.
-                    # For the purpose of reporting the attribute name, ensure it always ends with "_id" when
-                    # used in messages
-                    message_attr = attr if attr.endswith("_id") else f"{attr}_id"
-                    related_model: Model
-                    try:
-                        related_model = field_meta.related_model
-                        related_model_name = related_model._meta.object_name
-                        referenced_object = related_model.objects.get(pk=value)
-                    except related_model.DoesNotExist:
-                        return 404, {
-                            "api_error": f"{related_model_name} referenced by '{message_attr}' does not exist",
-                        }
-
-                    setattr(patched_object, attr, referenced_object)
-                else:
-                    setattr(patched_object, attr, value)
-
-            patched_object.save()
-            patched_object.refresh_from_db()
+                setattr(patched_object, attr, value)
+
+            # Only write the columns that were supplied, then re-read any
+            # the database may have changed.
+            patched_object.save(update_fields=[*patch_fields, *auto_now_field_names])
+            if db_computed_field_names:
+                patched_object.refresh_from_db(fields=[*db_computed_field_names])
 
             return 200, patched_object
 
         returned_func = ensure_unique_name(self.model_class, patch_view_func)
         return returned_func
 
-    @property
-    def url_path(self) -> str:
-        return "/{int:id}"
-
-    @property
-    def response_config(self) -> dict[int, Optional[Any]]:
-        return {200: self.response_schema, 404: DefaultErrorResponseSchema}
-
     def patch_view_signature(self, view_func: Callable) -> Callable:
         """
         To ensure that Ninja supplies our view with the appropriate payload
@@ -1,6 +1,117 @@
-from typing import Callable
+import sys
+from typing import Any, Callable, Optional, get_args
+from weakref import WeakKeyDictionary
 
-from django.db.models import Model
+from django.db.models import Field, Model
+from pydantic import BaseModel
+
+# Relation fields for each model class, see get_relation_fields()
+_relation_fields_cache: WeakKeyDictionary[type[Model], tuple[dict, dict]] = (
+    WeakKeyDictionary()
+)
+
+# View function name prefixes for each model class, see _model_prefix()
+_view_name_prefix_cache: WeakKeyDictionary[type[Model], str] = WeakKeyDictionary()
+
+
+def get_relation_fields(
+    model_class: type[Model],
+) -> tuple[dict[str, Field], dict[str, Field]]:
+    """
+    Return dictionaries of a model's forward Foreign Key (including one-to-one)
+    fields and M2M fields, keyed by field name. Only relations declared on the
+    model itself are included, not reverse relations declared by other models.
+
+    Model classes don't change once Django's app registry is ready, so the
+    result is computed once per model and shared.
+    """
+    relation_fields = _relation_fields_cache.get(model_class)
+    if relation_fields is None:
+        fk_fields = {
+            f.name: f
+            for f in model_class._meta.concrete_fields
+            if f.is_relation and (f.many_to_one or f.one_to_one)
+        }
+        m2m_fields = {f.name: f for f in model_class._meta.many_to_many}
+        relation_fields = _relation_fields_cache[model_class] = (fk_fields, m2m_fields)
+    return relation_fields
+
+
+def get_eager_loading_lookups(
+    model_class: type[Model],
+    schema: type[BaseModel],
+    prefix: str = "",
+    prefetch_only: bool = False,
+) -> tuple[list[str], list[str]]:
+    """
+    Work out the select_related() and prefetch_related() lookups needed so
+    that serializing instances of a model with the given schema doesn't run
+    extra queries for each related object.
+
+    A Foreign Key only needs loading when the schema nests the related
+    object; a plain ID is read from the model's own "<field>_id" column.
+    M2M fields always need fetching, and anything nested beneath an M2M
+    relation has to be prefetched as well.
+    """
+    select_related = []
+    prefetch_related = []
+    fk_fields, m2m_fields = get_relation_fields(model_class)
+
+    for name, schema_field in schema.model_fields.items():
+        nested_schema = _find_nested_schema(schema_field.annotation)
+        lookup = f"{prefix}{name}"
+
+        if name in fk_fields and nested_schema is not None:
+            related_model = fk_fields[name].related_model
+            nested_prefetch_only = prefetch_only
+            if prefetch_only:
+                prefetch_related.append(lookup)
+            else:
+                select_related.append(lookup)
+        elif name in m2m_fields:
+            related_model = m2m_fields[name].related_model
+            nested_prefetch_only = True
+            prefetch_related.append(lookup)
+        else:
+            continue
+
+        if nested_schema is not None:
+            nested_select, nested_prefetch = get_eager_loading_lookups(
+                related_model, nested_schema, f"{lookup}__", nested_prefetch_only
+            )
+            select_related.extend(nested_select)
+            prefetch_related.extend(nested_prefetch)
+
+    return select_related, prefetch_related
+
+
+def _find_nested_schema(annotation: Any) -> Optional[type[BaseModel]]:
+    """
+    Find the schema class within a field's annotation, if there is one.
+    For example, in "Optional[SomeSchema]" or "List[SomeSchema]".
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+
+    for argument in get_args(annotation):
+        nested_schema = _find_nested_schema(argument)
+        if nested_schema is not None:
+            return nested_schema
+
+    return None
+
+
+def _model_prefix(model_class: type[Model]) -> str:
+    """
+    Return the "<model name>_" prefix for a model's view function names,
+    worked out once per model class.
+    """
+    prefix = _view_name_prefix_cache.get(model_class)
+    if prefix is None:
+        prefix = _view_name_prefix_cache[model_class] = sys.intern(
+            model_class._meta.object_name.lower() + "_"
+        )
+    return prefix
 
 
 def ensure_unique_name(model_class: Model, view_func: Callable) -> Callable:
@@ -9,6 +120,16 @@ def ensure_unique_name(model_class: Model, view_func: Callable) -> Callable:
     As such, different models cannot have the same name for
     their view functions. As a result, we pre-pend the relevant
     model's name to the function.
+
+    Renamed functions are marked with the model they were renamed for,
+    so calling this more than once for the same function is harmless.
+    The name itself can't be relied on for this, as a model's prefix
+    may also be how a view function's name starts ("post_" for a model
+    called "Post", for example).
     """
-    view_func.__name__ = f"{model_class._meta.object_name.lower()}_{view_func.__name__}"
+    if getattr(view_func, "_autodojo_model", None) is model_class:
+        return view_func
+
+    view_func.__name__ = sys.intern(_model_prefix(model_class) + view_func.__name__)
+    setattr(view_func, "_autodojo_model", model_class)
     return view_func
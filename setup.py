@@ -1,5 +1,9 @@
+from pathlib import Path
+
 import setuptools
 
+long_description = (Path(__file__).parent / "README.md").read_text(encoding="utf-8")
+
 setuptools.setup(
     name="autodojo",
     version="0.1.0",
@@ -9,7 +13,8 @@ setuptools.setup(
     description=(
         "AutoDojo allows automatic creation of boilerplate Schemas and Views for basic CRUD operations on Django ORM Model classes."
     ),
-    long_description=open("README.md").read(),
+    long_description=long_description,
+    long_description_content_type="text/markdown",
     packages=setuptools.find_packages(),
     install_requires=["Django >=3.1", "pydantic >=2.0,<3.0.0", "django-ninja >=1.1.0"],
 )
@@ -1,14 +1,29 @@
 """
 The unit tests for the autodojo lib require some ORM
-models to be defined. Note: We don't actually need a database
-behind these, as we're only testing what AutoDojo will
-create when fed these model definitions.
+models to be defined. Note: Most of these don't need a database
+behind them, as we're only testing what AutoDojo will
+create when fed these model definitions. Those that are saved
+to the test database belong to the installed "tests" app.
 """
 
 from django.db import models
+from django.db.models.functions import Length
 
 
-class ChildModel(models.Model):
+class AutoDojoTestModel(models.Model):
+    """
+    Base class for the test models, so they share the same Meta options.
+    """
+
+    class Meta:
+        abstract = True
+        # We need to specify this to ensure the model resolution will work
+        app_label = "autodojo"
+        # Nothing is ever saved, so there's no need for Django to create tables
+        managed = False
+
+
+class ChildModel(AutoDojoTestModel):
     """
     This class represents the simplest of ORM/DB models:
     all simple fields, no foreign keys etc.
@@ -17,12 +32,8 @@ class ChildModel(models.Model):
     count = models.IntegerField()
     name = models.TextField()
 
-    class Meta:
-        # We need to specify this to ensure the model resolution will work
-        app_label = "autodojo"
-
 
-class ForeignKeyParentModel(models.Model):
+class ForeignKeyParentModel(AutoDojoTestModel):
     """
     This class is intended to provide a very simple foreign
     key relationship.
@@ -31,12 +42,8 @@ class ForeignKeyParentModel(models.Model):
     dummy = models.ForeignKey(ChildModel, on_delete=models.CASCADE)
     relation = models.TextField()
 
-    class Meta:
-        # We need to specify this to ensure the model resolution will work
-        app_label = "autodojo"
 
-
-class ManyToManyParentModel(models.Model):
+class ManyToManyParentModel(AutoDojoTestModel):
     """
     This class is intended to represent M2M relationships between
     two models where forward and reverse relations are defined.
@@ -45,6 +52,35 @@ class ManyToManyParentModel(models.Model):
     name = models.TextField()
     children = models.ManyToManyField("ChildModel", related_name="parents")
 
-    class Meta:
-        # We need to specify this to ensure the model resolution will work
-        app_label = "autodojo"
+
+class Post(models.Model):
+    """
+    A model whose name is also an HTTP method, so the prefixes given to
+    its view function names look like the names themselves.
+
+    Unlike the models above, this one is saved to the database, to test
+    generated views that write to it. It includes a field with its own
+    pre_save() behaviour, and one whose value is computed by the database.
+    """
+
+    title = models.TextField()
+    attachment = models.FileField(blank=True)
+    title_length = models.GeneratedField(
+        expression=Length("title"),
+        output_field=models.IntegerField(),
+        db_persist=True,
+    )
+
+
+class PostLink(models.Model):
+    """
+    A link from one post to another, so there are two foreign keys
+    referring to the same model.
+    """
+
+    source = models.ForeignKey(
+        Post, on_delete=models.CASCADE, related_name="outgoing_links"
+    )
+    target = models.ForeignKey(
+        Post, on_delete=models.CASCADE, related_name="incoming_links"
+    )
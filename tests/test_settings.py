@@ -14,3 +14,5 @@ DATABASES = {
         "NAME": BASE_DIR / "db.sqlite3",
     }
 }
+
+DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
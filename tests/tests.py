@@ -1,28 +1,113 @@
+import functools
 import inspect
+import json
+import logging
 import os
-import types
-from typing import Any, Callable, Type
+from collections import namedtuple
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Type, get_args, get_origin
 
-from django.http import HttpRequest
+# runtests.py points Django at the test settings before these tests are
+# imported; this only fills in for anything that doesn't.
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.test_settings")
+
+from django.db import connection
+from django.db.models import Model
+from django.db.models.signals import post_delete
+from django.http import HttpRequest, HttpResponse
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from ninja import Schema
 
-from .models import ChildModel
+from .models import (
+    ChildModel,
+    ForeignKeyParentModel,
+    ManyToManyParentModel,
+    Post,
+    PostLink,
+)
 from .schemas import DummySchema
 
-os.environ["DJANGO_SETTINGS_MODULE"] = "django_books_api.settings"
+from autodojo.autodojorouter import AutoDojoRouter
+from autodojo.autodojoview import AutoDojoView
+from autodojo.constants import DELETE, GET, GETLIST, PATCH, POST, PUT
+from autodojo.generators.utility import ensure_unique_name, get_eager_loading_lookups
 
-from ninja import Schema
 
-from autodojo.autodojoview import AutoDojoView
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def get_parameter_annotations(view_func: Callable) -> Mapping[str, Any]:
+    """
+    Map a view function's parameter names to their type annotations.
+    Generated view functions don't change once built, so there's no need
+    to inspect the same one more than once.
+    """
+    parameters = inspect.signature(view_func).parameters
+    return MappingProxyType(
+        {name: parameter.annotation for name, parameter in parameters.items()}
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_view(model_class: Type[Model], http_method: str) -> AutoDojoView:
+    """
+    Get the AutoDojoView for a model and HTTP method, with default
+    configuration. Generated views aren't modified by the tests, so
+    they can be shared between them.
+    """
+    return AutoDojoView(model_class, http_method)
+
+
+class ResponseSchema:
+    """
+    Stands in for the generated response schema within expected annotations,
+    like "list[ResponseSchema]", as it isn't known until the view is generated.
+    """
+
+
+# Stands in for the generated request schema as an expected parameter
+# annotation, and is checked for by identity.
+REQUEST_SCHEMA = object()
+
+
+class VerbExpectation(
+    namedtuple(
+        "VerbExpectation", "verb url_path response_status_codes view_func_signature"
+    )
+):
+    """
+    Expected results of basic view generation, for a single HTTP verb.
+    The expectations are shared by every test, so they're made read-only.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, verb, url_path, response_status_codes, view_func_signature):
+        return super().__new__(
+            cls,
+            verb,
+            url_path,
+            MappingProxyType(
+                {
+                    code: MappingProxyType(expected)
+                    for code, expected in response_status_codes.items()
+                }
+            ),
+            MappingProxyType(view_func_signature),
+        )
 
 
 # These assume that the Model class used was "Dummy".
 # This should affect names of generated response schema
 # classes
-HTTP_VERB_EXPECTATIONS = {
-    "GET": {
-        "url_path": "/{int:id}",
-        "response_status_codes": {
+HTTP_VERB_EXPECTATIONS = (
+    VerbExpectation(
+        verb=GET,
+        url_path="/{int:id}",
+        response_status_codes={
             200: {
                 "annotation": Schema,
                 "name": "GeneratedChildModelOut",
@@ -32,23 +117,24 @@ HTTP_VERB_EXPECTATIONS = {
                 "name": "DefaultErrorResponseSchema",
             },
         },
-        "view_func_signature": {"request": HttpRequest, "id": int},
-    },
-    "GETLIST": {
-        "url_path": "/",
-        "response_status_codes": {
+        view_func_signature={"request": HttpRequest, "id": int},
+    ),
+    VerbExpectation(
+        verb=GETLIST,
+        url_path="/",
+        response_status_codes={
             200: {
-                "annotation": list,
-                "name": Schema,
+                "annotation": list[ResponseSchema],
             },
         },
-        "view_func_signature": {
+        view_func_signature={
             "request": HttpRequest,
         },
-    },
-    "POST": {
-        "url_path": "/",
-        "response_status_codes": {
+    ),
+    VerbExpectation(
+        verb=POST,
+        url_path="/",
+        response_status_codes={
             200: {
                 "annotation": Schema,
                 "name": "GeneratedChildModelOut",
@@ -58,14 +144,15 @@ HTTP_VERB_EXPECTATIONS = {
                 "name": "DefaultErrorResponseSchema",
             },
         },
-        "view_func_signature": {
+        view_func_signature={
             "request": HttpRequest,
-            "payload": "REQUEST_SCHEMA",  # Special value, to match generated Inbound schema class
+            "payload": REQUEST_SCHEMA,
         },
-    },
-    "PUT": {
-        "url_path": "/{int:id}",
-        "response_status_codes": {
+    ),
+    VerbExpectation(
+        verb=PUT,
+        url_path="/{int:id}",
+        response_status_codes={
             200: {
                 "annotation": Schema,
                 "name": "GeneratedChildModelOut",
@@ -75,15 +162,16 @@ HTTP_VERB_EXPECTATIONS = {
                 "name": "DefaultErrorResponseSchema",
             },
         },
-        "view_func_signature": {
+        view_func_signature={
             "request": HttpRequest,
             "id": int,
-            "payload": "REQUEST_SCHEMA",
+            "payload": REQUEST_SCHEMA,
         },
-    },
-    "PATCH": {
-        "url_path": "/{int:id}",
-        "response_status_codes": {
+    ),
+    VerbExpectation(
+        verb=PATCH,
+        url_path="/{int:id}",
+        response_status_codes={
             200: {
                 "annotation": Schema,
                 "name": "GeneratedChildModelOut",
@@ -93,15 +181,16 @@ HTTP_VERB_EXPECTATIONS = {
                 "name": "DefaultErrorResponseSchema",
             },
         },
-        "view_func_signature": {
+        view_func_signature={
             "request": HttpRequest,
             "id": int,
-            "payload": "REQUEST_SCHEMA",
+            "payload": REQUEST_SCHEMA,
         },
-    },
-    "DELETE": {
-        "url_path": "/{int:id}",
-        "response_status_codes": {
+    ),
+    VerbExpectation(
+        verb=DELETE,
+        url_path="/{int:id}",
+        response_status_codes={
             200: {
                 "annotation": None,
             },
@@ -110,15 +199,365 @@ HTTP_VERB_EXPECTATIONS = {
                 "name": "DefaultErrorResponseSchema",
             },
         },
-        "view_func_signature": {
+        view_func_signature={
             "request": HttpRequest,
             "id": int,
         },
-    },
+    ),
+)
+
+
+def check_no_response(
+    test_case: TestCase,
+    response: Any,
+    status_expectations: Mapping[str, Any],
+    response_schema: Type[Schema],
+):
+    test_case.assertEqual(response, None)
+
+
+def check_class_response(
+    test_case: TestCase,
+    response: Any,
+    status_expectations: Mapping[str, Any],
+    response_schema: Type[Schema],
+):
+    expected_type = status_expectations["annotation"]
+    test_case.assertTrue(
+        issubclass(response, expected_type),
+        f"{response!r} is not a subclass of {expected_type!r}",
+    )
+    # For class-based expected response types, check the name
+    if "name" in status_expectations:
+        test_case.assertEqual(response.__name__, status_expectations["name"])
+
+
+def check_generic_response(
+    test_case: TestCase,
+    response: Any,
+    status_expectations: Mapping[str, Any],
+    response_schema: Type[Schema],
+):
+    expected_type = status_expectations["annotation"]
+    test_case.assertIs(get_origin(response), get_origin(expected_type))
+
+    # The ResponseSchema placeholder should have been filled in by the
+    # generated response schema.
+    expected_args = tuple(
+        response_schema if arg is ResponseSchema else arg
+        for arg in get_args(expected_type)
+    )
+    actual_args = get_args(response)
+    test_case.assertEqual(len(actual_args), len(expected_args))
+    for actual_arg, expected_arg in zip(actual_args, expected_args):
+        test_case.assertIs(actual_arg, expected_arg)
+
+
+# Expected response annotations that are generic containers of the
+# response schema, rather than classes in their own right.
+GENERIC_TYPES = frozenset((list, dict, tuple))
+
+# How to check a response, by its expected annotation (or the origin of a
+# generic annotation). Anything not listed is expected to be a class.
+RESPONSE_CHECKERS: dict[Any, Callable[..., None]] = {
+    None: check_no_response,
+    **dict.fromkeys(GENERIC_TYPES, check_generic_response),
 }
 
 
+class TestRouterGeneration(TestCase):
+    def test_required_kwargs_are_enforced(self):
+        with self.assertRaisesMessage(ValueError, "'app_label' cannot be None"):
+            AutoDojoRouter(model="ChildModel")
+
+        with self.assertRaisesMessage(ValueError, "'model' cannot be None"):
+            AutoDojoRouter(app_label="autodojo")
+
+    def test_routers_get_their_own_view_functions(self):
+        """
+        Ninja records details of the operation a view function is registered
+        for on the function itself, so routers for the same model mustn't
+        share view functions.
+        """
+
+        def get_operation():
+            router = AutoDojoRouter(app_label="tests", model="Post", http_methods=[GET])
+            return router.router.path_operations["/{int:id}"].operations[0]
+
+        first_operation = get_operation()
+        second_operation = get_operation()
+
+        self.assertIsNot(first_operation.view_func, second_operation.view_func)
+        self.assertIs(first_operation.view_func._ninja_operation, first_operation)
+        self.assertIs(second_operation.view_func._ninja_operation, second_operation)
+
+
+class TestEagerLoadingLookups(TestCase):
+    def test_flat_foreign_keys_are_not_joined(self):
+        """
+        Without nesting, a Foreign Key is serialized from the "<field>_id"
+        column, so there's nothing worth loading.
+        """
+        schema = get_view(ForeignKeyParentModel, GETLIST).response_schema
+        lookups = get_eager_loading_lookups(ForeignKeyParentModel, schema)
+        self.assertEqual(lookups, ([], []))
+
+    def test_nested_foreign_keys_are_selected(self):
+        schema = AutoDojoView(
+            ForeignKeyParentModel, "GETLIST", response_schema_config={"depth": 1}
+        ).response_schema
+        lookups = get_eager_loading_lookups(ForeignKeyParentModel, schema)
+        self.assertEqual(lookups, (["dummy"], []))
+
+    def test_many_to_many_fields_are_prefetched(self):
+        schema = get_view(ManyToManyParentModel, GETLIST).response_schema
+        lookups = get_eager_loading_lookups(ManyToManyParentModel, schema)
+        self.assertEqual(lookups, ([], ["children"]))
+
+
+class TestPatchViews(TestCase):
+    """
+    PATCH views apply payloads with a single UPDATE query where they can,
+    and otherwise fetch, modify and save() the object.
+    """
+
+    def setUp(self):
+        self.post = Post.objects.create(title="First post")
+        self.auto_view = AutoDojoView(Post, PATCH)
+
+    def patch(self, id: int, **fields: Any) -> tuple[int, Any]:
+        payload = self.auto_view.request_schema(**fields)
+        return self.auto_view.view_func(None, id, payload)
+
+    def test_plain_fields_are_updated_in_place(self):
+        with CaptureQueriesContext(connection) as queries:
+            status, patched_post = self.patch(self.post.pk, title="Updated post")
+
+        self.assertEqual(status, 200)
+        self.assertEqual(patched_post.title, "Updated post")
+        self.assertEqual(patched_post.title_length, 12)
+        self.assertEqual(Post.objects.get(pk=self.post.pk).title, "Updated post")
+
+        # Updated, then read back
+        self.assertEqual(len(queries), 2)
+        self.assertTrue(queries[0]["sql"].startswith("UPDATE"))
+
+    def test_fields_with_pre_save_behaviour_are_saved(self):
+        with CaptureQueriesContext(connection) as queries:
+            status, patched_post = self.patch(
+                self.post.pk, title="Renamed", attachment="notes.txt"
+            )
+
+        self.assertEqual(status, 200)
+        self.assertEqual(patched_post.attachment.name, "notes.txt")
+        # Computed by the database, so must have been re-read after saving
+        self.assertEqual(patched_post.title_length, 7)
+
+        saved_post = Post.objects.get(pk=self.post.pk)
+        self.assertEqual(saved_post.title, "Renamed")
+        self.assertEqual(saved_post.attachment.name, "notes.txt")
+
+        # Fetched, saved, then database-computed fields re-read
+        self.assertEqual(len(queries), 3)
+        self.assertTrue(queries[0]["sql"].startswith("SELECT"))
+        self.assertTrue(queries[1]["sql"].startswith("UPDATE"))
+
+    def test_missing_objects_are_not_found(self):
+        missing_id = self.post.pk + 1
+        for fields in ({"title": "Updated post"}, {"attachment": "notes.txt"}):
+            with self.subTest(fields=fields):
+                status, body = self.patch(missing_id, **fields)
+                self.assertEqual(status, 404)
+                self.assertEqual(
+                    body, {"api_error": "Requested Post object does not exist"}
+                )
+
+
+class TestDeleteViews(TestCase):
+    """
+    DELETE views only fetch the primary key of the object being deleted,
+    unless something may read its other fields while it's deleted.
+    """
+
+    def setUp(self):
+        self.post = Post.objects.create(title="First post")
+        self.auto_view = AutoDojoView(Post, DELETE)
+
+    def test_only_the_primary_key_is_fetched(self):
+        with CaptureQueriesContext(connection) as queries:
+            result = self.auto_view.view_func(None, self.post.pk)
+
+        self.assertEqual(result, (200, None))
+        self.assertFalse(Post.objects.filter(pk=self.post.pk).exists())
+        self.assertNotIn('"title"', queries[0]["sql"])
+
+    def test_delete_receivers_can_read_fields(self):
+        deleted_titles = []
+
+        def record_title(sender, instance, **kwargs):
+            deleted_titles.append(instance.title)
+
+        post_delete.connect(record_title, sender=Post)
+        self.addCleanup(post_delete.disconnect, record_title, sender=Post)
+
+        result = self.auto_view.view_func(None, self.post.pk)
+
+        self.assertEqual(result, (200, None))
+        self.assertEqual(deleted_titles, ["First post"])
+        self.assertFalse(Post.objects.filter(pk=self.post.pk).exists())
+
+    def test_missing_objects_are_not_found(self):
+        status, body = self.auto_view.view_func(None, self.post.pk + 1)
+        self.assertEqual(status, 404)
+        self.assertEqual(body, {"api_error": "Requested Post object does not exist"})
+
+
+class TestForeignKeyReferences(TestCase):
+    """
+    Views that write objects resolve the foreign key references in their
+    payloads with one query per related model, reporting any that don't
+    exist.
+    """
+
+    def setUp(self):
+        self.first_post = Post.objects.create(title="First post")
+        self.second_post = Post.objects.create(title="Second post")
+        self.link = PostLink.objects.create(
+            source=self.first_post, target=self.first_post
+        )
+
+    def write(self, http_method: str, payload: dict[str, Any]) -> Any:
+        auto_view = AutoDojoView(PostLink, http_method)
+        request_payload = auto_view.request_schema.model_validate(payload)
+        if http_method == POST:
+            return auto_view.view_func(None, request_payload)
+        return auto_view.view_func(None, self.link.pk, request_payload)
+
+    def test_references_to_the_same_model_are_fetched_together(self):
+        payload = {"source_id": self.second_post.pk, "target_id": self.first_post.pk}
+        for http_method in (POST, PUT, PATCH):
+            with self.subTest(http_method=http_method):
+                with CaptureQueriesContext(connection) as queries:
+                    result = self.write(http_method, payload)
+
+                # Views for existing objects return a status code as well
+                saved_link = result if http_method == POST else result[1]
+                self.assertEqual(saved_link.source, self.second_post)
+                self.assertEqual(saved_link.target, self.first_post)
+
+                post_queries = [
+                    query
+                    for query in queries
+                    if query["sql"].startswith("SELECT")
+                    and 'FROM "tests_post"' in query["sql"]
+                ]
+                self.assertEqual(len(post_queries), 1)
+
+    def test_missing_references_are_reported(self):
+        payload = {
+            "source_id": self.first_post.pk,
+            "target_id": self.second_post.pk + 1,
+        }
+        error = {"api_error": "Post referenced by 'target_id' does not exist!"}
+        # Creating an object with a missing reference is a bad request,
+        # while changing one to refer to a missing object is not found.
+        for http_method, status in ((POST, 400), (PUT, 404), (PATCH, 404)):
+            with self.subTest(http_method=http_method):
+                self.assertEqual(self.write(http_method, payload), (status, error))
+
+        self.assertEqual(PostLink.objects.get().target, self.first_post)
+
+
+class TestFastJsonRendering(TestCase):
+    """
+    Views generated with fast JSON rendering serialize their responses
+    themselves, returning ready-made HttpResponse objects.
+    """
+
+    def setUp(self):
+        self.first_post = Post.objects.create(title="First post")
+        self.second_post = Post.objects.create(title="Second post")
+
+    def assertJsonResponse(self, response: Any, status: int, body: Any):
+        self.assertIsInstance(response, HttpResponse)
+        self.assertEqual(response.status_code, status)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(json.loads(response.content), body)
+
+    def serialized(self, post: Post) -> dict[str, Any]:
+        return {
+            "id": post.pk,
+            "title": post.title,
+            "attachment": None,
+            "title_length": len(post.title),
+        }
+
+    def test_fast_json_rendering(self):
+        """
+        When fast JSON rendering is requested, the generated view should keep
+        the signature Ninja inspects, and responses should be serialized
+        using the generated response schema.
+        """
+        auto_view = AutoDojoView(ChildModel, GET, fast_json_rendering=True)
+
+        annotations = get_parameter_annotations(auto_view.view_func)
+        self.assertEqual(annotations["id"], int)
+
+        rendered = auto_view.generator_class.render_response(
+            None, 200, ChildModel(id=1, count=2, name="child")
+        )
+        self.assertEqual(json.loads(rendered), {"id": 1, "count": 2, "name": "child"})
+
+        rendered = auto_view.generator_class.render_response(
+            None, 404, {"api_error": "Not found"}
+        )
+        self.assertEqual(json.loads(rendered), {"api_error": "Not found"})
+
+    def test_views_return_rendered_responses(self):
+        auto_view = AutoDojoView(Post, GET, fast_json_rendering=True)
+
+        response = auto_view.view_func(None, self.first_post.pk)
+        self.assertJsonResponse(response, 200, self.serialized(self.first_post))
+
+        response = auto_view.view_func(None, self.second_post.pk + 1)
+        self.assertJsonResponse(
+            response, 404, {"api_error": "Requested Post object does not exist"}
+        )
+
+    def test_list_views_render_every_object(self):
+        auto_view = AutoDojoView(Post, GETLIST, fast_json_rendering=True)
+
+        response = auto_view.view_func(None)
+        self.assertJsonResponse(
+            response,
+            200,
+            [self.serialized(self.first_post), self.serialized(self.second_post)],
+        )
+
+    def test_responses_without_a_schema_are_passed_through(self):
+        auto_view = AutoDojoView(Post, DELETE, fast_json_rendering=True)
+
+        self.assertEqual(auto_view.view_func(None, self.first_post.pk), (200, None))
+        self.assertFalse(Post.objects.filter(pk=self.first_post.pk).exists())
+
+    def test_bare_results_are_rendered_as_200(self):
+        generator = AutoDojoView(Post, GET).generator_class
+
+        def view_func(request):
+            return self.first_post
+
+        response = generator.wrap_json_rendering(view_func)(None)
+        self.assertJsonResponse(response, 200, self.serialized(self.first_post))
+
+
 class TestBasicViewGeneration(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.views = AutoDojoView.generate_all(
+            ChildModel, [expectations.verb for expectations in HTTP_VERB_EXPECTATIONS]
+        )
+
     def test_exception_raised_if_schema_and_config_provided(self):
         """
         The AutoDojoView classes are designed to raise an exception if an
@@ -156,6 +595,75 @@ class TestBasicViewGeneration(TestCase):
                 "Supplied response_schema_config will be ignored because response_schema class was supplied",
             )
 
+    def test_unsupported_method_raises(self):
+        with self.assertRaisesMessage(ValueError, "Unsupported HTTP method: HEAD"):
+            AutoDojoView(ChildModel, "HEAD")
+
+    def test_relation_fields_are_detected(self):
+        """
+        Generators should note forward FK and M2M fields declared on a model,
+        but not the reverse relations other models declare against it.
+        """
+        generator = AutoDojoView(ForeignKeyParentModel, "GET").generator_class
+        self.assertEqual(list(generator.fk_fields), ["dummy"])
+        self.assertEqual(generator.m2m_fields, {})
+
+        generator = AutoDojoView(ManyToManyParentModel, "GET").generator_class
+        self.assertEqual(generator.fk_fields, {})
+        self.assertEqual(list(generator.m2m_fields), ["children"])
+
+        generator = AutoDojoView(ChildModel, "GET").generator_class
+        self.assertEqual(generator.fk_fields, {})
+        self.assertEqual(generator.m2m_fields, {})
+
+        # The model's relations are only worked out once, and shared
+        other_generator = AutoDojoView(ChildModel, "DELETE").generator_class
+        self.assertIs(generator.fk_fields, other_generator.fk_fields)
+        self.assertIs(generator.m2m_fields, other_generator.m2m_fields)
+
+    def test_generated_schemas_are_shared(self):
+        """
+        Generating views for the same model and verb, with the same schema
+        configuration, should re-use previously generated schema classes
+        rather than building new ones.
+        """
+        first_view = AutoDojoView(ChildModel, "PUT")
+        second_view = AutoDojoView(ChildModel, "PUT")
+        self.assertIs(first_view.request_schema, second_view.request_schema)
+        self.assertIs(first_view.response_schema, second_view.response_schema)
+
+        # A different configuration must result in a different schema
+        configured_view = AutoDojoView(
+            ChildModel, "PUT", response_schema_config={"exclude": ["count"]}
+        )
+        self.assertIsNot(configured_view.response_schema, first_view.response_schema)
+        self.assertNotIn("count", configured_view.response_schema.model_fields)
+
+    def test_generate_all(self):
+        views = AutoDojoView.generate_all(ChildModel, [GET, PUT, DELETE])
+        self.assertEqual(list(views), [GET, PUT, DELETE])
+        self.assertEqual(views[PUT].url_path, "/{int:id}")
+        self.assertIs(views[GET].response_schema, views[PUT].response_schema)
+
+        with self.assertRaisesMessage(ValueError, "Unsupported HTTP method: HEAD"):
+            AutoDojoView.generate_all(ChildModel, [GET, "HEAD"])
+
+    def test_unique_name_is_only_applied_once(self):
+        def get_view_func():
+            pass
+
+        self.assertIs(ensure_unique_name(ChildModel, get_view_func), get_view_func)
+        ensure_unique_name(ChildModel, get_view_func)
+        self.assertEqual(get_view_func.__name__, "childmodel_get_view_func")
+
+    def test_unique_name_when_model_name_matches_view_name(self):
+        self.assertEqual(
+            AutoDojoView(Post, POST).view_func.__name__, "post_post_view_func"
+        )
+        self.assertEqual(
+            AutoDojoView(Post, GET).view_func.__name__, "post_get_view_func"
+        )
+
     def test_basic_view_generation_for_methods(self):
         """
         For each of the verbs that we have generator classes for,
@@ -165,89 +673,74 @@ class TestBasicViewGeneration(TestCase):
         - No schema config parameters, other than those defined as
           defaults inside the Verb-specific subclass of AutoDojoViewGenerator
         """
-        for http_verb, expectations in HTTP_VERB_EXPECTATIONS.items():
-            print(f"\n--[[ Testing basic view generation for verb: {http_verb} ]]--")
-            auto_view = AutoDojoView(ChildModel, http_verb)
+        for expectations in HTTP_VERB_EXPECTATIONS:
+            http_verb = expectations.verb
+            logger.debug(
+                "--[[ Testing basic view generation for verb: %s ]]--", http_verb
+            )
+            auto_view = self.views[http_verb]
 
-            self.assertEqual(auto_view.url_path, expectations["url_path"])
-            print(f"    - Expected URL path matched {expectations['url_path']}")
+            self.assertEqual(auto_view.url_path, expectations.url_path)
+            logger.debug("    - Expected URL path matched %s", expectations.url_path)
 
             # Inspect the response dictionary that was generated
-            print("  --[[ Inspecting generated view response configuration ]]--")
+            logger.debug("  --[[ Inspecting generated view response configuration ]]--")
             self.inspect_generated_response_config(
                 auto_view.response_config, expectations, auto_view.response_schema
             )
 
             # Inspect the signature of the generated View function
-            print("  --[[ Inspecting generated view function signature ]]--")
+            logger.debug("  --[[ Inspecting generated view function signature ]]--")
             self.inspect_generated_view_func_signature(
                 auto_view.view_func, expectations, auto_view.request_schema
             )
 
-            print(f"--[[ End of {http_verb}-specific test ]]--")
+            logger.debug("--[[ End of %s-specific test ]]--", http_verb)
 
     def inspect_generated_view_func_signature(
         self,
         view_func: Callable,
-        expectations: dict[str, Any],
+        expectations: VerbExpectation,
         request_schema: Type[Schema] = None,
     ):
-        signature = inspect.signature(view_func)
-        params = signature.parameters
+        annotations = get_parameter_annotations(view_func)
 
-        for expected_name, expected_annotation in expectations[
-            "view_func_signature"
-        ].items():
-            self.assertIn(expected_name, params)
+        expected_signature = expectations.view_func_signature
+        for expected_name, expected_annotation in expected_signature.items():
+            self.assertIn(expected_name, annotations)
+            annotation = annotations[expected_name]
 
-            # The special string, "REQUEST_SCHEMA" for the expected
+            # The special value, REQUEST_SCHEMA for the expected
             # annotation indicates we want to see that the request schema
             # that was generated is the same class as the given parameter's
             # type.
-            if expected_annotation == "REQUEST_SCHEMA":
+            if expected_annotation is REQUEST_SCHEMA:
                 self.assertTrue(
-                    issubclass(params[expected_name].annotation, request_schema)
+                    issubclass(annotation, request_schema),
+                    f"{annotation!r} is not a subclass of {request_schema!r}",
                 )
             else:
-                self.assertEqual(params[expected_name].annotation, expected_annotation)
+                self.assertEqual(annotation, expected_annotation)
 
     def inspect_generated_response_config(
         self,
         response_dict: dict[int, Any],
-        expectations: dict[str, Any],
+        expectations: VerbExpectation,
         response_schema: Schema = None,
     ):
         # Confirm expected number of status-codes in returned response dict
-        self.assertEqual(
-            len(response_dict.keys()),
-            len(expectations["response_status_codes"].keys()),
-        )
+        expected_status_codes = expectations.response_status_codes
+        self.assertEqual(len(response_dict), len(expected_status_codes))
 
-        for status_code, status_expectations in expectations[
-            "response_status_codes"
-        ].items():
+        for status_code, status_expectations in expected_status_codes.items():
             # Is the expected status code defined in the returned response dict?
-            print(f"    - Status code: {status_code}")
-            self.assertTrue(status_code in response_dict.keys())
+            logger.debug("    - Status code: %s", status_code)
+            self.assertIn(status_code, response_dict)
 
-            #
             expected_type = status_expectations["annotation"]
-            if expected_type is None:
-                self.assertEqual(response_dict[status_code], None)
-            elif expected_type not in [list, dict, tuple]:
-                # Class types
-                self.assertTrue(issubclass(response_dict[status_code], expected_type))
-                # For class-based expected response types, check the name
-                if "name" in status_expectations:
-                    self.assertEqual(
-                        response_dict[status_code].__name__,
-                        status_expectations["name"],
-                    )
-            else:
-                # TODO: Work out how to inspect the type the list contains
-                # types.GenericAlias was introduced in 3.9
-                # https://docs.python.org/3/library/stdtypes.html#types-genericalias
-                self.assertEqual(
-                    response_dict[status_code],
-                    types.GenericAlias(expected_type, response_schema),
-                )
+            check_response = RESPONSE_CHECKERS.get(
+                get_origin(expected_type) or expected_type, check_class_response
+            )
+            check_response(
+                self, response_dict[status_code], status_expectations, response_schema
+            )